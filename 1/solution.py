@@ -1,11 +1,16 @@
 """Solution to the first advent of code problem."""
 import re
+from argparse import ArgumentParser
 from pathlib import Path
 
+from aoc_common.checkpoint import sum_answers, update_checkpoint
+
 ROOT = Path(__file__).parent
 """Root of the solution."""
 DATA_PATH = ROOT.joinpath("data.txt")
 """Path to the data input file."""
+CHECKPOINT_PATH = ROOT.joinpath("checkpoint.json")
+"""Path to the checkpoint saved by incremental runs."""
 
 DigitChar = str
 """A single numeric character."""
@@ -37,47 +42,70 @@ This matches overlapping numbers (e.g. 'nineight' unpacks to ['nine', 'eight']).
 """
 
 
-def load_data(parse_written_numbers: bool = False) -> list[list[DigitChar]]:
-    """Load the relevant data."""
+def parse_data(
+    data: bytes, parse_written_numbers: bool = False
+) -> list[list[DigitChar]]:
+    """Parse the digits from each line of the data."""
     lines = []
-    with DATA_PATH.open("r", encoding="utf-8") as file:
-        for line in file:
-            line = line.rstrip()
-            if not line:
-                continue
-
-            if not parse_written_numbers:
-                line_digits: list[str] = list(filter(str.isnumeric, line))
-            else:
-                line_digits = list(
-                    re.findall(NUMERIC_OR_WRITTEN_REGEX, line)
-                )
-                for index, digit in enumerate(line_digits):
-                    if digit.isnumeric():
-                        continue
-                    line_digits[index] = WRITTEN_NUMBER_REPLACEMENTS[digit]
-                if not line_digits:
-                    print(line)
-
-            lines.append(line_digits)
+    for line in data.decode("utf-8").splitlines():
+        line = line.rstrip()
+        if not line:
+            continue
+
+        if not parse_written_numbers:
+            line_digits: list[str] = list(filter(str.isnumeric, line))
+        else:
+            line_digits = list(re.findall(NUMERIC_OR_WRITTEN_REGEX, line))
+            for index, digit in enumerate(line_digits):
+                if digit.isnumeric():
+                    continue
+                line_digits[index] = WRITTEN_NUMBER_REPLACEMENTS[digit]
+            if not line_digits:
+                print(line)
+
+        lines.append(line_digits)
     return lines
 
 
+def load_data(parse_written_numbers: bool = False) -> list[list[DigitChar]]:
+    """Load the relevant data."""
+    return parse_data(DATA_PATH.read_bytes(), parse_written_numbers)
+
+
 def calculate_calibration_value(data: list[list[DigitChar]]) -> int:
     """Calculate the numeric calibration value."""
     return sum(int(line[0] + line[-1]) for line in data)
 
 
-def main():
+def solve(data: bytes) -> dict[str, int]:
+    """Solve both parts of the problem for the data."""
+    return {
+        "calibration_value": calculate_calibration_value(parse_data(data)),
+        "written_calibration_value": calculate_calibration_value(
+            parse_data(data, parse_written_numbers=True)
+        ),
+    }
+
+
+def main(incremental: bool = False):
     """Run the advent of code solution."""
-    part_1_data = load_data()
-    print("Calibration value:", calculate_calibration_value(part_1_data))
-    part_2_data = load_data(parse_written_numbers=True)
+    if incremental:
+        answers = update_checkpoint(CHECKPOINT_PATH, DATA_PATH, sum_answers(solve))
+    else:
+        answers = solve(DATA_PATH.read_bytes())
+
+    print("Calibration value:", answers["calibration_value"])
     print(
         "Calibration value when parsing written numbers:",
-        calculate_calibration_value(part_2_data),
+        answers["written_calibration_value"],
     )
 
 
 if __name__ == "__main__":
-    main()
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only process the lines appended since the last incremental run.",
+    )
+    main(**vars(parser.parse_args()))
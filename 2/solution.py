@@ -1,12 +1,18 @@
 """Solution to the second advent of code problem."""
+from argparse import ArgumentParser
 from collections import Counter
 from math import prod
 from pathlib import Path
 
+from aoc_common.checkpoint import sum_answers, update_checkpoint
+from aoc_common.parsing import iter_lines, parse_counted_tokens, parse_integer
+
 ROOT = Path(__file__).parent
 """Root of the solution."""
 DATA_PATH = ROOT.joinpath("data.txt")
 """Path to the data input file."""
+CHECKPOINT_PATH = ROOT.joinpath("checkpoint.json")
+"""Path to the checkpoint saved by incremental runs."""
 
 GameID = int
 """The ID of a game played by the elf."""
@@ -19,31 +25,39 @@ Game = dict[CubeColour, MaxCubeCount]
 Games = dict[GameID, Game]
 """Information about the games played."""
 
+CUBE_COLOURS: dict[bytes, CubeColour] = {
+    b"red": "red",
+    b"green": "green",
+    b"blue": "blue",
+}
+"""The cube colours, by their encoded names in the data."""
 
-def load_data() -> Games:
-    """Load the relevant data."""
-    games: Games = {}
-    with DATA_PATH.open("r", encoding="utf-8") as file:
-        for line in map(str.rstrip, file):
-            if not line:
-                continue
-            game: Game = Counter()
 
-            game_id_string, game_results = line.split(": ", 1)
-            game_id = int(game_id_string.split(" ", 1)[-1])
+def parse_data(data: bytes) -> Games:
+    """Parse the games from the data."""
+    games: Games = {}
+    for line in iter_lines(data):
+        game: Game = Counter()
 
-            for round_result in game_results.split("; "):
-                for colour_result in round_result.split(", "):
-                    count_str, colour = colour_result.split(" ", 1)
-                    count = int(count_str)
+        game_id_field, _, game_results = line.partition(b":")
+        game_id = parse_integer(game_id_field)
 
-                    if game[colour] < count:
-                        game[colour] = count
+        # The maximum count is all that matters, so rounds can be ignored.
+        for count, colour_name in parse_counted_tokens(game_results):
+            # Colours not known in advance are still counted.
+            colour = CUBE_COLOURS.get(colour_name) or colour_name.decode("utf-8")
+            if game[colour] < count:
+                game[colour] = count
 
-            games[game_id] = game
+        games[game_id] = game
     return games
 
 
+def load_data() -> Games:
+    """Load the relevant data."""
+    return parse_data(DATA_PATH.read_bytes())
+
+
 def calculate_sum_of_ids(data: Games) -> int:
     """Calculate the sum of the IDs of games where counts meet certain criteria."""
     total = 0
@@ -63,12 +77,31 @@ def calculate_sum_of_powers(data: Games) -> int:
     return sum(map(lambda counts: prod(counts.values()), data.values()))
 
 
-def main():
+def solve(data: bytes) -> dict[str, int]:
+    """Solve both parts of the problem for the data."""
+    games = parse_data(data)
+    return {
+        "sum_of_ids": calculate_sum_of_ids(games),
+        "sum_of_powers": calculate_sum_of_powers(games),
+    }
+
+
+def main(incremental: bool = False):
     """Run the advent of code solution."""
-    part_1_data = load_data()
-    print("Sum of IDs:", calculate_sum_of_ids(part_1_data))
-    print("Sum of powers:", calculate_sum_of_powers(part_1_data))
+    if incremental:
+        answers = update_checkpoint(CHECKPOINT_PATH, DATA_PATH, sum_answers(solve))
+    else:
+        answers = solve(DATA_PATH.read_bytes())
+
+    print("Sum of IDs:", answers["sum_of_ids"])
+    print("Sum of powers:", answers["sum_of_powers"])
 
 
 if __name__ == "__main__":
-    main()
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only process the games appended since the last incremental run.",
+    )
+    main(**vars(parser.parse_args()))
@@ -27,36 +27,44 @@ class Symbol:
     value: str
 
 
-def load_data() -> tuple[list[list[Number]], list[list[Symbol]]]:
+def parse_data(data: bytes) -> tuple[list[list[Number]], list[list[Symbol]]]:
     """
-    Load the relevant data from the engine schematic, parsing the numbers
-    and symbols on each line.
+    Parse the engine schematic from the data, parsing the numbers and symbols
+    on each line.
 
     """
     all_numbers, all_symbols = [], []
 
-    with DATA_PATH.open("r", encoding="utf-8") as file:
-        for line in map(str.rstrip, file):
-            line_numbers = []
-            line_symbols = []
+    for line in map(str.rstrip, data.decode("utf-8").splitlines()):
+        line_numbers = []
+        line_symbols = []
 
-            for number_match in re.finditer(r"[0-9]+", line):
-                value = int(number_match.group(0))
-                span = number_match.span()
+        for number_match in re.finditer(r"[0-9]+", line):
+            value = int(number_match.group(0))
+            span = number_match.span()
 
-                number = Number(start_index=span[0], end_index=span[1] - 1, value=value)
-                line_numbers.append(number)
+            number = Number(start_index=span[0], end_index=span[1] - 1, value=value)
+            line_numbers.append(number)
 
-            for symbol_match in re.finditer(r"[^0-9\.]", line):
-                symbol = Symbol(symbol_match.start(), symbol_match.group(0))
-                line_symbols.append(symbol)
+        for symbol_match in re.finditer(r"[^0-9\.]", line):
+            symbol = Symbol(symbol_match.start(), symbol_match.group(0))
+            line_symbols.append(symbol)
 
-            all_numbers.append(line_numbers)
-            all_symbols.append(line_symbols)
+        all_numbers.append(line_numbers)
+        all_symbols.append(line_symbols)
 
     return all_numbers, all_symbols
 
 
+def load_data() -> tuple[list[list[Number]], list[list[Symbol]]]:
+    """
+    Load the relevant data from the engine schematic, parsing the numbers
+    and symbols on each line.
+
+    """
+    return parse_data(DATA_PATH.read_bytes())
+
+
 def calculate_part_number_sum(
     numbers: list[list[Number]], symbols: list[list[Symbol]]
 ) -> int:
@@ -106,11 +114,20 @@ def calculate_gear_ratio_sum(
     return total
 
 
+def solve(data: bytes) -> dict[str, int]:
+    """Solve both parts of the problem for the data."""
+    numbers, symbols = parse_data(data)
+    return {
+        "part_number_sum": calculate_part_number_sum(numbers, symbols),
+        "gear_ratio_sum": calculate_gear_ratio_sum(numbers, symbols),
+    }
+
+
 def main():
     """Run the advent of code solution."""
-    numbers, symbols = load_data()
-    print("Part number sum:", calculate_part_number_sum(numbers, symbols))
-    print("Gear ratio sum:", calculate_gear_ratio_sum(numbers, symbols))
+    answers = solve(DATA_PATH.read_bytes())
+    print("Part number sum:", answers["part_number_sum"])
+    print("Gear ratio sum:", answers["gear_ratio_sum"])
 
 
 if __name__ == "__main__":
@@ -1,12 +1,18 @@
 """Solution to the fourth advent of code problem."""
+from argparse import ArgumentParser
 from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
 
+from aoc_common.checkpoint import State, update_checkpoint
+from aoc_common.parsing import iter_integers, iter_lines, parse_integer
+
 ROOT = Path(__file__).parent
 """Root of the solution."""
 DATA_PATH = ROOT.joinpath("data.txt")
 """Path to the data input file."""
+CHECKPOINT_PATH = ROOT.joinpath("checkpoint.json")
+"""Path to the checkpoint saved by incremental runs."""
 
 ScratchcardID = int
 """The ID of the scratchcard."""
@@ -34,39 +40,52 @@ class Scratchcard:
         return 2 ** (n_matching_numbers - 1)
 
 
-def load_data() -> list[Scratchcard]:
-    """Load the relevant data from the scratchcards."""
+def parse_data(data: bytes) -> list[Scratchcard]:
+    """Parse the scratchcards from the data."""
     scratchcards = []
 
-    with DATA_PATH.open("r", encoding="utf-8") as file:
-        for line in map(str.rstrip, file):
-            card_info, numbers = line.split(": ", 1)
-            winning_numbers_str, drawn_numbers_str = numbers.split(" | ", 1)
+    for line in iter_lines(data):
+        card_info, _, numbers = line.partition(b":")
+        winning_numbers_field, _, drawn_numbers_field = numbers.partition(b"|")
 
-            card_number = int(card_info.split(" ", 1)[-1])
-            winning_numbers = set(map(int, winning_numbers_str.split()))
-            drawn_numbers = set(map(int, drawn_numbers_str.split()))
+        card_number = parse_integer(card_info)
+        winning_numbers = set(iter_integers(winning_numbers_field))
+        drawn_numbers = set(iter_integers(drawn_numbers_field))
 
-            scratchcards.append(
-                Scratchcard(card_number, winning_numbers, drawn_numbers)
-            )
+        scratchcards.append(Scratchcard(card_number, winning_numbers, drawn_numbers))
 
     return scratchcards
 
 
+def load_data() -> list[Scratchcard]:
+    """Load the relevant data from the scratchcards."""
+    return parse_data(DATA_PATH.read_bytes())
+
+
 def calculate_score(scratchcards: list[Scratchcard]) -> int:
     """Calculate the sum of the scores from the scratchcards."""
     return sum(scratchcard.score() for scratchcard in scratchcards)
 
 
-def count_scratchcards(scratchcards: list[Scratchcard]) -> int:
-    """Count the number of scratchcards evaluated according to the rules."""
+def count_scratchcards(
+    scratchcards: list[Scratchcard],
+    extra_copies: Counter[ScratchcardID] | None = None,
+) -> int:
+    """
+    Count the number of scratchcards evaluated according to the rules.
+
+    If provided, `extra_copies` holds the copies won by earlier scratchcards
+    and is updated in place, so only copies of scratchcards which have not
+    been evaluated yet remain.
+
+    """
     n_scratchcards = 0
 
-    extra_copies: Counter[ScratchcardID] = Counter()
+    if extra_copies is None:
+        extra_copies = Counter()
     for scratchcard in scratchcards:
         scratchcard_number = scratchcard.number
-        n_cards = 1 + extra_copies[scratchcard_number]
+        n_cards = 1 + extra_copies.pop(scratchcard_number, 0)
 
         n_matching_numbers = scratchcard.n_matching_numbers
         for n in range(1, n_matching_numbers + 1):
@@ -77,12 +96,50 @@ def count_scratchcards(scratchcards: list[Scratchcard]) -> int:
     return n_scratchcards
 
 
-def main():
+def update_answers(answers: State, data: bytes) -> State:
+    """
+    Add the answers for the scratchcards appended to the data file to the
+    answers so far, keeping the copies won of scratchcards not yet seen.
+
+    """
+    scratchcards = parse_data(data)
+    extra_copies: Counter[ScratchcardID] = Counter()
+    for number, n_copies in answers.get("extra_copies", {}).items():
+        # JSON object keys are always strings.
+        extra_copies[int(number)] = n_copies
+    return {
+        "score": answers.get("score", 0) + calculate_score(scratchcards),
+        "n_scratchcards": answers.get("n_scratchcards", 0)
+        + count_scratchcards(scratchcards, extra_copies),
+        "extra_copies": dict(extra_copies),
+    }
+
+
+def solve(data: bytes) -> dict[str, int]:
+    """Solve both parts of the problem for the data."""
+    scratchcards = parse_data(data)
+    return {
+        "score": calculate_score(scratchcards),
+        "n_scratchcards": count_scratchcards(scratchcards),
+    }
+
+
+def main(incremental: bool = False):
     """Run the advent of code solution."""
-    scratchcards = load_data()
-    print("Scratchcard score sum:", calculate_score(scratchcards))
-    print("Total scratchcards evaluated:", count_scratchcards(scratchcards))
+    if incremental:
+        answers = update_checkpoint(CHECKPOINT_PATH, DATA_PATH, update_answers)
+    else:
+        answers = solve(DATA_PATH.read_bytes())
+
+    print("Scratchcard score sum:", answers["score"])
+    print("Total scratchcards evaluated:", answers["n_scratchcards"])
 
 
 if __name__ == "__main__":
-    main()
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only process the scratchcards appended since the last incremental run.",
+    )
+    main(**vars(parser.parse_args()))
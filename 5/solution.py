@@ -4,6 +4,8 @@ from collections import deque
 from collections.abc import Sequence
 from pathlib import Path
 
+from aoc_common.parsing import iter_integers, iter_lines, parse_integers
+
 ROOT = Path(__file__).parent
 """Root of the solution."""
 DATA_PATH = ROOT.joinpath("data.txt")
@@ -115,36 +117,36 @@ class OffsetMapping:
         return output_ranges
 
 
-def load_data() -> tuple[Seeds, Sequence[OffsetMapping]]:
-    """Load the relevant data from the almanac."""
-    with DATA_PATH.open("r", encoding="utf-8") as file:
-        lines = map(str.rstrip, file)
-
-        seeds_line = next(lines)
-        seeds = list(map(int, seeds_line.split(": ", 1)[-1].split()))
-        next(lines)  # Skip the empty line.
-
-        offset_mappings = []
-        while True:
-            try:
-                map_definition = next(lines)
-            except StopIteration:
-                break
-            if not map_definition:
-                break
-            offset_mapping = OffsetMapping(name=map_definition.split(" ")[0])
-
-            for line in iter(lines.__next__, ""):
-                target_start, source_start, length = map(int, line.split(" ", 3))
-                source_range = range(source_start, source_start + length)
-                offset = target_start - source_start
-                offset_mapping[source_range] = offset
+def parse_data(data: bytes) -> tuple[Seeds, Sequence[OffsetMapping]]:
+    """Parse the almanac from the data."""
+    lines = iter_lines(data)
+    seeds = parse_integers(next(lines))
 
+    offset_mappings = []
+    offset_mapping: OffsetMapping | None = None
+    for line in lines:
+        # A line such as `seed-to-soil map:` defines a new map.
+        if line.endswith(b":"):
+            name = line.partition(b" ")[0].decode("utf-8")
+            offset_mapping = OffsetMapping(name=name)
             offset_mappings.append(offset_mapping)
+            continue
+        if offset_mapping is None:
+            raise ValueError(f"Range before the first map definition: {line!r}")
+
+        target_start, source_start, length = iter_integers(line)
+        source_range = range(source_start, source_start + length)
+        offset = target_start - source_start
+        offset_mapping[source_range] = offset
 
     return seeds, offset_mappings
 
 
+def load_data() -> tuple[Seeds, Sequence[OffsetMapping]]:
+    """Load the relevant data from the almanac."""
+    return parse_data(DATA_PATH.read_bytes())
+
+
 def get_lowest_location_number(
     seeds: Seeds, offset_mappings: Sequence[OffsetMapping]
 ) -> int:
@@ -179,13 +181,24 @@ def get_lowest_location_number_from_ranges(
     return min(location_numbers)
 
 
+def solve(data: bytes) -> dict[str, int]:
+    """Solve both parts of the problem for the data."""
+    seeds, offset_mappings = parse_data(data)
+    return {
+        "lowest_location_number": get_lowest_location_number(seeds, offset_mappings),
+        "lowest_location_number_from_ranges": get_lowest_location_number_from_ranges(
+            seeds, offset_mappings
+        ),
+    }
+
+
 def main():
     """Run the advent of code solution."""
-    seeds, offset_mappings = load_data()
-    print("Lowest location number:", get_lowest_location_number(seeds, offset_mappings))
+    answers = solve(DATA_PATH.read_bytes())
+    print("Lowest location number:", answers["lowest_location_number"])
     print(
         "Lowest location number from seed range:",
-        get_lowest_location_number_from_ranges(seeds, offset_mappings),
+        answers["lowest_location_number_from_ranges"],
     )
 
 
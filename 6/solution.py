@@ -1,9 +1,10 @@
 """Solution to the sixth advent of code problem."""
-import re
 from dataclasses import dataclass
 from math import prod
 from pathlib import Path
 
+from aoc_common.parsing import iter_lines, parse_integers
+
 ROOT = Path(__file__).parent
 """Root of the solution."""
 DATA_PATH = ROOT.joinpath("data.txt")
@@ -25,17 +26,17 @@ class RaceRecord:
         return total
 
 
+def parse_data(data: bytes) -> list[RaceRecord]:
+    """Parse the race records from the data."""
+    lines = iter_lines(data)
+    times = parse_integers(next(lines))
+    distances = parse_integers(next(lines))
+    return [RaceRecord(time, distance) for time, distance in zip(times, distances)]
+
+
 def load_data() -> list[RaceRecord]:
     """Load the relevant data from the race records."""
-    with DATA_PATH.open("r", encoding="utf-8") as file:
-        lines = map(str.rstrip, file)
-        times_line = next(lines)
-        distances_line = next(lines)
-
-        pattern = re.compile("[0-9]+")
-        times = map(int, pattern.findall(times_line))
-        distances = map(int, pattern.findall(distances_line))
-        return [RaceRecord(time, distance) for time, distance in zip(times, distances)]
+    return parse_data(DATA_PATH.read_bytes())
 
 
 def product_of_ways_to_beat_record(race_records: list[RaceRecord]):
@@ -55,14 +56,24 @@ def count_ways_to_beat_record_in_long_race(race_records: list[RaceRecord]):
     return RaceRecord(long_time, long_distance).count_ways_to_beat()
 
 
+def solve(data: bytes) -> dict[str, int]:
+    """Solve both parts of the problem for the data."""
+    race_records = parse_data(data)
+    return {
+        "ways_to_beat_record": product_of_ways_to_beat_record(race_records),
+        "ways_to_beat_record_in_long_race": count_ways_to_beat_record_in_long_race(
+            race_records
+        ),
+    }
+
+
 def main():
     """Run the advent of code solution."""
-    race_records = load_data()
-    print("Ways to beat record:", product_of_ways_to_beat_record(race_records))
-    race_records = load_data()
+    answers = solve(DATA_PATH.read_bytes())
+    print("Ways to beat record:", answers["ways_to_beat_record"])
     print(
         "Ways to beat record in long race:",
-        count_ways_to_beat_record_in_long_race(race_records),
+        answers["ways_to_beat_record_in_long_race"],
     )
 
 
@@ -3,6 +3,8 @@ from collections import Counter
 from pathlib import Path
 from typing import Literal, get_args
 
+from aoc_common.parsing import iter_lines, parse_integer
+
 ROOT = Path(__file__).parent
 """Root of the solution."""
 DATA_PATH = ROOT.joinpath("data.txt")
@@ -73,15 +75,19 @@ class Hand:
                 return 0
 
 
+def parse_data(data: bytes) -> list[Hand]:
+    """Parse the poker hands from the data."""
+    hands = []
+    for line in iter_lines(data):
+        cards, _, bet_field = line.partition(b" ")
+        hand = Hand(cards.decode("utf-8"), parse_integer(bet_field))  # type: ignore
+        hands.append(hand)
+    return hands
+
+
 def load_data() -> list[Hand]:
     """Load the poker hands."""
-    with DATA_PATH.open("r", encoding="utf-8") as file:
-        lines = map(str.rstrip, file)
-        hands = []
-        for line in lines:
-            cards, bet_str = line.split(" ", 1)
-            hands.append(Hand(cards, int(bet_str)))  # type: ignore
-        return hands
+    return parse_data(DATA_PATH.read_bytes())
 
 
 def count_winnings(hands: list[Hand]) -> Bet:
@@ -101,11 +107,20 @@ def count_winnings_with_jokers(hands: list[Hand]) -> Bet:
     return sum(rank * hand.bet for rank, hand in enumerate(hands, 1))
 
 
+def solve(data: bytes) -> dict[str, int]:
+    """Solve both parts of the problem for the data."""
+    hands = parse_data(data)
+    return {
+        "winnings": count_winnings(hands),
+        "winnings_with_jokers": count_winnings_with_jokers(hands),
+    }
+
+
 def main():
     """Run the advent of code solution."""
-    hands = load_data()
-    print("Total winnings:", count_winnings(hands))
-    print("Total winnings with jokers:", count_winnings_with_jokers(hands))
+    answers = solve(DATA_PATH.read_bytes())
+    print("Total winnings:", answers["winnings"])
+    print("Total winnings with jokers:", answers["winnings_with_jokers"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,7 @@
+"""
+Code shared between the solutions.
+
+The solutions which use this package are run as modules from the root of the
+repository (e.g. `python -m 1.solution`), so that it can be imported.
+
+"""
@@ -0,0 +1,109 @@
+"""
+Checkpoints for incremental runs, so a solution only has to process the lines
+appended to its data file since the last run.
+
+A checkpoint records how far through the data file the last run got, along
+with the state built from the lines processed so far. The checkpoint is
+discarded (and the data file processed from the start) if the data file no
+longer starts with the processed lines.
+
+"""
+import json
+import os
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, BinaryIO
+
+State = dict[str, Any]
+"""The state built from the processed lines, which must be JSON serialisable."""
+Update = Callable[[State, bytes], State]
+"""A function updating the state with the lines appended to the data file."""
+
+
+@dataclass
+class Checkpoint:
+    """The progress through the data file saved after an incremental run."""
+
+    offset: int = 0
+    """The byte offset of the first line which has not been processed."""
+    inode: int | None = None
+    """The inode of the data file, to detect the file being replaced."""
+    tail_length: int = 0
+    """The length of the last processed line, in bytes."""
+    tail_digest: str = sha256().hexdigest()
+    """The SHA-256 digest of the last processed line."""
+    state: State = field(default_factory=dict)
+    """The state built from the processed lines."""
+
+
+def _load_checkpoint(checkpoint_path: Path, file: BinaryIO) -> Checkpoint:
+    """
+    Load the checkpoint for the open data file, starting afresh if there is
+    no checkpoint or it doesn't match the data file.
+
+    """
+    try:
+        checkpoint = Checkpoint(
+            **json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        )
+    except (FileNotFoundError, ValueError, TypeError):
+        return Checkpoint()
+
+    stat = os.fstat(file.fileno())
+    if checkpoint.inode != stat.st_ino or checkpoint.offset > stat.st_size:
+        return Checkpoint()
+    file.seek(checkpoint.offset - checkpoint.tail_length)
+    if sha256(file.read(checkpoint.tail_length)).hexdigest() != checkpoint.tail_digest:
+        return Checkpoint()
+    return checkpoint
+
+
+def _save_checkpoint(checkpoint_path: Path, checkpoint: Checkpoint) -> None:
+    """Save the checkpoint, replacing the previous checkpoint atomically."""
+    temporary_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+    temporary_path.write_text(json.dumps(asdict(checkpoint)), encoding="utf-8")
+    os.replace(temporary_path, checkpoint_path)
+
+
+def update_checkpoint(checkpoint_path: Path, data_path: Path, update: Update) -> State:
+    """
+    Update the state from the last checkpoint with the complete lines appended
+    to the data file since, saving and returning the new state.
+
+    A trailing partial line is left to be processed by the next run.
+
+    """
+    with data_path.open("rb") as file:
+        checkpoint = _load_checkpoint(checkpoint_path, file)
+        file.seek(checkpoint.offset)
+        data = file.read()
+        inode = os.fstat(file.fileno()).st_ino
+    data = data[: data.rfind(b"\n") + 1]
+
+    checkpoint.inode = inode
+    checkpoint.state = update(checkpoint.state, data)
+    if data:
+        tail = data[data.rfind(b"\n", 0, -1) + 1 :]
+        checkpoint.offset += len(data)
+        checkpoint.tail_length = len(tail)
+        checkpoint.tail_digest = sha256(tail).hexdigest()
+
+    _save_checkpoint(checkpoint_path, checkpoint)
+    return checkpoint.state
+
+
+def sum_answers(solve: Callable[[bytes], dict[str, int]]) -> Update:
+    """
+    Get an update for solutions whose answers are sums over the lines, adding
+    the answers for the appended lines to the answers so far.
+
+    """
+
+    def update(answers: State, data: bytes) -> State:
+        return {
+            name: answers.get(name, 0) + answer for name, answer in solve(data).items()
+        }
+
+    return update
@@ -0,0 +1,55 @@
+"""
+Helpers to parse the input data directly from bytes, without decoding it to
+strings.
+
+Fields are tokenised by translating separators to spaces and splitting on
+whitespace, as this is faster than matching a regex pattern for each token or
+scanning the bytes in Python. Integers are parsed to Python ints, which can't
+overflow, as the fields each hold only a few numbers.
+
+"""
+from collections.abc import Iterator
+
+_KEEP_INTEGERS = bytes(
+    byte if byte in b"-0123456789" else ord(" ") for byte in range(256)
+)
+"""A translation table replacing every byte except digits and `-` with a space."""
+_KEEP_ALPHANUMERICS = bytes(
+    byte if chr(byte).isascii() and chr(byte).isalnum() else ord(" ")
+    for byte in range(256)
+)
+"""A translation table replacing every byte except letters and digits with a space."""
+
+
+def iter_lines(data: bytes) -> Iterator[bytes]:
+    """Iterate over the non-blank lines in the data, without trailing whitespace."""
+    return filter(None, map(bytes.rstrip, data.splitlines()))
+
+
+def iter_integers(field: bytes) -> Iterator[int]:
+    """
+    Iterate over the (possibly negative) integers in a field.
+
+    Any byte other than a digit or `-` separates integers. A `ValueError` is
+    raised for a `-` which isn't the sign of an integer (e.g. `1-2` or `- 3`).
+
+    """
+    return map(int, field.translate(_KEEP_INTEGERS).split())
+
+
+def parse_integers(field: bytes) -> list[int]:
+    """Parse the integers in a field (see `iter_integers`) to a list."""
+    return list(iter_integers(field))
+
+
+def parse_integer(field: bytes) -> int:
+    """Parse the only integer in a field (see `iter_integers`)."""
+    return int(field.translate(_KEEP_INTEGERS))
+
+
+def parse_counted_tokens(field: bytes) -> list[tuple[int, bytes]]:
+    """Parse the counts and the tokens which follow them (e.g. `3 blue, 4 red`)."""
+    tokens = field.translate(_KEEP_ALPHANUMERICS).split()
+    if len(tokens) % 2:
+        raise ValueError(f"Unpaired count or token in {field!r}")
+    return list(zip(map(int, tokens[::2]), tokens[1::2]))
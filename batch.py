@@ -0,0 +1,96 @@
+"""
+Solve many input files for a day in parallel, writing the answers for each
+file as a JSON line in the order they complete.
+
+"""
+import json
+import sys
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from functools import partial
+from glob import iglob
+from multiprocessing import Pool
+from pathlib import Path
+
+from solutions import DAYS, DEFAULT_WORKERS, load_solution, positive_int, solve
+
+
+def find_inputs(patterns: list[str]) -> list[Path]:
+    """
+    Find the input files matching each pattern.
+
+    A pattern may be a directory (all files directly within it are used, but
+    not those in subdirectories) or a glob pattern, in which `**` matches any
+    number of nested directories. A `FileNotFoundError` is raised if any
+    pattern matches no files.
+
+    """
+    paths = []
+    for pattern in patterns:
+        if Path(pattern).is_dir():
+            matches = sorted(filter(Path.is_file, Path(pattern).iterdir()))
+        else:
+            matches = sorted(
+                filter(Path.is_file, map(Path, iglob(pattern, recursive=True)))
+            )
+        if not matches:
+            raise FileNotFoundError(f"No input files match {pattern!r}")
+        paths.extend(matches)
+    return paths
+
+
+def solve_file(day: int, path: Path) -> dict:
+    """Solve the problem for a day from an input file, recording any error."""
+    try:
+        # Keep anything the solutions print out of the JSON lines.
+        with redirect_stdout(sys.stderr):
+            answers = solve(day, path.read_bytes())
+    except Exception as error:
+        return {"path": str(path), "error": f"{type(error).__name__}: {error}"}
+    return {"path": str(path), "answers": answers}
+
+
+def main():
+    """Solve the input files, writing the results to stdout."""
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("day", type=int, choices=DAYS, help="The day to solve.")
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help=(
+            "Directories (not searched recursively) or glob patterns of input "
+            "files, where '**' matches nested directories."
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=positive_int,
+        default=DEFAULT_WORKERS,
+        help="The number of worker processes (default: the number of CPUs).",
+    )
+    args = parser.parse_args()
+
+    try:
+        paths = find_inputs(args.inputs)
+    except FileNotFoundError as error:
+        parser.error(str(error))
+    # Send several files to a worker at a time to amortise the IPC, while
+    # keeping the chunks small enough to balance the load.
+    chunksize = max(1, len(paths) // (args.workers * 8))
+
+    n_errors = 0
+    # Each worker imports the solution once and reuses it for every file.
+    with Pool(args.workers, initializer=load_solution, initargs=(args.day,)) as pool:
+        results = pool.imap_unordered(
+            partial(solve_file, args.day), paths, chunksize=chunksize
+        )
+        for result in results:
+            n_errors += "error" in result
+            print(json.dumps(result), flush=True)
+
+    sys.exit(1 if n_errors else 0)
+
+
+if __name__ == "__main__":
+    main()
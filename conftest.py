@@ -0,0 +1,5 @@
+"""
+Configuration for pytest. Its presence puts the root of the repository on the
+import path, so the tests can import the shared modules.
+
+"""
@@ -0,0 +1,478 @@
+"""
+A long-running daemon which solves the advent of code problems over a Unix
+domain socket, keeping the solutions imported between requests.
+
+A request is a line containing the day followed by the input data, after
+which the client shuts down its end of the connection for writing. The
+response is a single JSON line. A request line of `stats` returns the
+daemon's latency and throughput counters instead.
+
+"""
+import asyncio
+import json
+import signal
+import sys
+import time
+from argparse import ArgumentParser, ArgumentTypeError
+from collections.abc import Awaitable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TypeVar
+from weakref import WeakSet
+
+from solutions import DAYS, DEFAULT_WORKERS, ROOT, load_solution, positive_int, solve
+
+SOCKET_PATH = ROOT.joinpath("daemon.sock")
+"""The default path of the daemon's socket."""
+MAX_INPUT_SIZE = 16 * 1024 * 1024
+"""The default maximum size of the input data for a request, in bytes."""
+READ_SIZE = 64 * 1024
+"""The number of bytes to read from a connection at a time."""
+HEADER_SIZE_LIMIT = 1024
+"""The maximum length of a request line, in bytes."""
+BACKLOG = 1024
+"""The number of connections which can wait to be accepted."""
+TIMEOUT = 60.0
+"""The default time limit for solving a request, in seconds."""
+READ_TIMEOUT = 10.0
+"""The default time limit for receiving each part of a request, in seconds."""
+RETRIES = 1
+"""The number of times a request is retried after a worker dies solving it."""
+
+T = TypeVar("T")
+
+
+@dataclass
+class Stats:
+    """Latency and throughput counters for the daemon."""
+
+    start_time: float = field(default_factory=time.monotonic)
+    """The monotonic time the daemon started."""
+    n_pending: int = 0
+    """The number of requests received which have not been answered."""
+    n_solved: int = 0
+    """The number of requests answered successfully."""
+    n_failed: int = 0
+    """The number of requests answered with an error."""
+    total_latency: float = 0.0
+    """The total time taken to answer the requests, in seconds."""
+    max_latency: float = 0.0
+    """The longest time taken to answer a request, in seconds."""
+
+    def record(self, latency: float, failed: bool) -> None:
+        """Record an answered request."""
+        if failed:
+            self.n_failed += 1
+        else:
+            self.n_solved += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def to_dict(self) -> dict[str, float]:
+        """Get the counters, with the derived throughput and mean latency."""
+        uptime = time.monotonic() - self.start_time
+        n_answered = self.n_solved + self.n_failed
+        return {
+            "uptime_s": uptime,
+            "pending": self.n_pending,
+            "solved": self.n_solved,
+            "failed": self.n_failed,
+            "requests_per_s": n_answered / uptime,
+            "mean_latency_ms": 1000 * self.total_latency / max(n_answered, 1),
+            "max_latency_ms": 1000 * self.max_latency,
+        }
+
+
+def load_solutions() -> None:
+    """Import the solutions for every day."""
+    for day in DAYS:
+        load_solution(day)
+
+
+def init_worker() -> None:
+    """Set up a worker process, leaving signal handling to the daemon."""
+    # Forked workers inherit the event loop's signal wakeup file descriptor,
+    # so a signal sent to a worker would otherwise stop the daemon.
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    load_solutions()
+
+
+def terminate_executor(
+    executor: ProcessPoolExecutor, cancel_futures: bool = False
+) -> None:
+    """
+    Kill the worker processes of a pool and shut it down without waiting.
+
+    Any requests submitted to the pool fail with `BrokenProcessPool`, unless
+    `cancel_futures` is set, in which case those not yet started are cancelled.
+
+    """
+    # There's no public way to stop a running task, so the processes are
+    # killed directly (they are forgotten by the pool once it is shut down).
+    processes = list(executor._processes.values())  # type: ignore[union-attr]
+    executor.shutdown(wait=False, cancel_futures=cancel_futures)
+    for process in processes:
+        process.kill()
+
+
+async def read_header(reader: asyncio.StreamReader) -> bytes:
+    """Read the request line, without the trailing newline."""
+    try:
+        header = await reader.readuntil(b"\n")
+    except asyncio.LimitOverrunError as error:
+        raise ValueError("Request line too long") from error
+    except asyncio.IncompleteReadError as error:
+        raise ValueError("Request line not ended by a newline") from error
+    if len(header) > HEADER_SIZE_LIMIT:
+        raise ValueError("Request line too long")
+    return header.strip()
+
+
+async def read_within(read: Awaitable[T], timeout: float) -> T:
+    """Wait for a read from a connection, giving up after the time limit."""
+    try:
+        return await asyncio.wait_for(read, timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"Request not received within {timeout} seconds") from None
+
+
+async def read_input(reader: asyncio.StreamReader, max_size: int) -> bytes:
+    """Read the input data until the end of the stream."""
+    chunks = []
+    size = 0
+    while chunk := await reader.read(READ_SIZE):
+        size += len(chunk)
+        if size > max_size:
+            raise ValueError(f"Input data larger than {max_size} bytes")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+class Daemon:
+    """Answers requests, solving them in a pool of worker processes."""
+
+    def __init__(
+        self,
+        n_workers: int,
+        max_pending: int,
+        max_input_size: int,
+        timeout: float,
+        read_timeout: float,
+    ):
+        self.n_workers = n_workers
+        """The number of worker processes."""
+        self.max_input_size = max_input_size
+        """The maximum size of the input data for a request, in bytes."""
+        self.timeout = timeout
+        """The time limit for solving a request, in seconds."""
+        self.read_timeout = read_timeout
+        """The time limit for receiving each part of a request, in seconds."""
+        self.executor = self._create_executor()
+        """
+        The pool of worker processes.
+
+        This is replaced if a worker dies or a request runs out of time.
+
+        """
+        self._terminated_executors: WeakSet[ProcessPoolExecutor] = WeakSet()
+        """Pools terminated because a request ran out of time."""
+        self.slots = asyncio.Semaphore(max_pending)
+        """
+        Slots for the requests being read or solved.
+
+        Input data is not read until a slot is free, so clients with waiting
+        requests are held back once the socket buffers fill.
+
+        """
+        self.workers = asyncio.Semaphore(n_workers)
+        """The worker processes free to solve a request."""
+        self.stats = Stats()
+        """The latency and throughput counters."""
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """Create a pool of worker processes."""
+        return ProcessPoolExecutor(self.n_workers, initializer=init_worker)
+
+    async def warm_up(self) -> None:
+        """Start the worker processes, so the first requests are not slowed."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self.executor, load_solutions)
+                for _ in range(self.n_workers)
+            )
+        )
+
+    async def replace_executor(
+        self, executor: ProcessPoolExecutor, terminate: bool = False
+    ) -> None:
+        """
+        Replace a broken pool (or, if `terminate` is set, a pool with a request
+        which has run out of time) with a new warmed pool.
+
+        Nothing is done if the pool has already been replaced.
+
+        """
+        if executor is not self.executor:
+            return
+        self.executor = self._create_executor()
+        if terminate:
+            self._terminated_executors.add(executor)
+            terminate_executor(executor)
+        else:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        try:
+            await self.warm_up()
+        except BrokenProcessPool:
+            pass  # Replaced again by the request which broke it.
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer a request from a connection."""
+        start_time = time.perf_counter()
+        try:
+            try:
+                header = await read_within(read_header(reader), self.read_timeout)
+            except (ValueError, TimeoutError) as error:
+                response = {"error": f"{type(error).__name__}: {error}"}
+                self.stats.record(time.perf_counter() - start_time, failed=True)
+            else:
+                if header == b"stats":
+                    response = self.stats.to_dict()
+                else:
+                    response = await self.solve(header, reader, start_time)
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def solve(
+        self, header: bytes, reader: asyncio.StreamReader, start_time: float
+    ) -> dict:
+        """Solve the problem for the day in the header using the input data."""
+        self.stats.n_pending += 1
+        try:
+            async with self.slots:
+                day = int(header)
+                if day not in DAYS:
+                    raise ValueError(f"No solution for day {day}")
+                data = await read_within(
+                    read_input(reader, self.max_input_size), self.read_timeout
+                )
+                answers = await self.run(day, data)
+        except Exception as error:
+            response = {"error": f"{type(error).__name__}: {error}"}
+        else:
+            response = {"answers": answers}
+        finally:
+            self.stats.n_pending -= 1
+
+        self.stats.record(time.perf_counter() - start_time, "error" in response)
+        return response
+
+    async def run(self, day: int, data: bytes) -> dict[str, int]:
+        """
+        Solve the problem in the pool of worker processes, replacing the pool
+        if a worker dies or the time limit is reached.
+
+        A request is retried if its pool was terminated because a different
+        request ran out of time, or (up to `RETRIES` times) if a worker in its
+        pool died, as the worker may have been solving a different request.
+
+        """
+        loop = asyncio.get_running_loop()
+        retries = RETRIES
+        while True:
+            # Only submit the request once a worker is free, so the time limit
+            # doesn't include time spent queued behind other requests.
+            async with self.workers:
+                executor = self.executor
+                try:
+                    task = loop.run_in_executor(executor, solve, day, data)
+                    return await asyncio.wait_for(task, self.timeout)
+                except asyncio.TimeoutError:
+                    await self.replace_executor(executor, terminate=True)
+                    message = f"Not solved within {self.timeout} seconds"
+                    raise TimeoutError(message) from None
+                except BrokenProcessPool:
+                    if executor in self._terminated_executors:
+                        continue
+                    await self.replace_executor(executor)
+                    if not retries:
+                        raise
+                    retries -= 1
+
+
+async def check_socket_unused(socket_path: Path) -> None:
+    """
+    Check that no daemon is listening on the socket, so that the socket can
+    be replaced.
+
+    """
+    try:
+        _, writer = await asyncio.open_unix_connection(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return
+    writer.close()
+    raise FileExistsError(f"A daemon is already listening on {socket_path}")
+
+
+async def serve(
+    socket_path: Path,
+    n_workers: int,
+    max_pending: int,
+    max_input_size: int,
+    timeout: float,
+    read_timeout: float,
+) -> None:
+    """Run the daemon until it is interrupted or terminated."""
+    await check_socket_unused(socket_path)
+
+    # Import the solutions before the workers are started, so forked workers
+    # inherit them.
+    load_solutions()
+    daemon = Daemon(n_workers, max_pending, max_input_size, timeout, read_timeout)
+    await daemon.warm_up()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, stop.set)
+
+    socket_path.unlink(missing_ok=True)
+    server = await asyncio.start_unix_server(
+        daemon.handle, socket_path, backlog=BACKLOG
+    )
+    try:
+        async with server:
+            print(f"Listening on {socket_path}", file=sys.stderr)
+            await stop.wait()
+    finally:
+        socket_path.unlink(missing_ok=True)
+        # Don't wait for requests still being solved.
+        terminate_executor(daemon.executor, cancel_futures=True)
+
+
+async def send_request(socket_path: Path, header: str, data: bytes = b"") -> dict:
+    """Send a request to the daemon, returning the response."""
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    try:
+        writer.write(header.encode("utf-8") + b"\n")
+        writer.write(data)
+        await writer.drain()
+        writer.write_eof()
+        response = await reader.readline()
+        if not response:
+            raise ConnectionError("The daemon closed the connection without answering")
+        return json.loads(response)
+    finally:
+        writer.close()
+
+
+def positive_float(value: str) -> float:
+    """Parse a positive number command line argument."""
+    number = float(value)
+    if not number > 0:
+        raise ArgumentTypeError(f"must be greater than 0, not {number}")
+    return number
+
+
+def main():
+    """Run the daemon, or send it a request."""
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=SOCKET_PATH,
+        help=f"The path of the daemon's socket (default: {SOCKET_PATH}).",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="Run the daemon.")
+    serve_parser.add_argument(
+        "-j",
+        "--workers",
+        type=positive_int,
+        default=DEFAULT_WORKERS,
+        help="The number of worker processes (default: the number of CPUs).",
+    )
+    serve_parser.add_argument(
+        "--max-pending",
+        type=positive_int,
+        default=None,
+        help="The number of requests read or solved at once (default: 4 per worker).",
+    )
+    serve_parser.add_argument(
+        "--max-input-size",
+        type=positive_int,
+        default=MAX_INPUT_SIZE,
+        help="The maximum size of the input data for a request, in bytes.",
+    )
+    serve_parser.add_argument(
+        "--timeout",
+        type=positive_float,
+        default=TIMEOUT,
+        help=f"The time limit for solving a request, in seconds (default: {TIMEOUT}).",
+    )
+    serve_parser.add_argument(
+        "--read-timeout",
+        type=positive_float,
+        default=READ_TIMEOUT,
+        help=(
+            "The time limit for receiving the request line and then the input "
+            f"data, in seconds (default: {READ_TIMEOUT})."
+        ),
+    )
+
+    solve_parser = commands.add_parser("solve", help="Solve an input using the daemon.")
+    solve_parser.add_argument("day", type=int, choices=DAYS, help="The day to solve.")
+    solve_parser.add_argument(
+        "input",
+        type=Path,
+        nargs="?",
+        help="The input file (default: read from stdin).",
+    )
+
+    commands.add_parser("stats", help="Get the daemon's counters.")
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        max_pending = args.max_pending or 4 * args.workers
+        try:
+            asyncio.run(
+                serve(
+                    args.socket,
+                    args.workers,
+                    max_pending,
+                    args.max_input_size,
+                    args.timeout,
+                    args.read_timeout,
+                )
+            )
+        except FileExistsError as error:
+            sys.exit(str(error))
+        return
+
+    if args.command == "solve":
+        data = args.input.read_bytes() if args.input else sys.stdin.buffer.read()
+        request = send_request(args.socket, str(args.day), data)
+    else:
+        request = send_request(args.socket, "stats")
+    try:
+        response = asyncio.run(request)
+    except ConnectionError as error:
+        sys.exit(str(error))
+    print(json.dumps(response))
+    sys.exit(1 if "error" in response else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Helpers to import and run the advent of code solutions by day."""
+import sys
+from argparse import ArgumentTypeError
+from importlib.util import module_from_spec, spec_from_file_location
+from os import cpu_count
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).parent
+"""Root of the repository."""
+DAYS = sorted(int(path.parent.name) for path in ROOT.glob("[0-9]*/solution.py"))
+"""The days which have a solution."""
+
+DEFAULT_WORKERS = cpu_count() or 1
+"""The default number of worker processes (the number of CPUs, if known)."""
+
+Answers = dict[str, int]
+"""The answers to each part of a problem, by name."""
+
+
+def load_solution(day: int) -> ModuleType:
+    """
+    Import the solution module for a day.
+
+    The solution directories are not valid package names, so the modules are
+    imported from their paths and cached as `day_<day>_solution`.
+
+    """
+    name = f"day_{day}_solution"
+    if name in sys.modules:
+        return sys.modules[name]
+    if day not in DAYS:
+        raise ValueError(f"No solution for day {day}")
+
+    spec = spec_from_file_location(name, ROOT.joinpath(str(day), "solution.py"))
+    assert spec is not None and spec.loader is not None
+    module = module_from_spec(spec)
+    # Dataclasses look up their module in `sys.modules` when created.
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def solve(day: int, data: bytes) -> Answers:
+    """Solve the problem for a day using the input data."""
+    try:
+        return load_solution(day).solve(data)
+    except StopIteration as error:
+        # Raised by parsers which run out of lines. It can't be raised
+        # into an asyncio future, so would leave a daemon request hanging.
+        raise ValueError("Input data ended unexpectedly") from error
+
+
+def positive_int(value: str) -> int:
+    """Parse a positive integer command line argument."""
+    number = int(value)
+    if number < 1:
+        raise ArgumentTypeError(f"must be at least 1, not {number}")
+    return number
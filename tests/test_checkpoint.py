@@ -0,0 +1,175 @@
+"""
+Tests that incremental runs give the same answers as solving the whole data
+file at once, however the appended data is split between runs.
+
+"""
+import os
+import random
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from aoc_common.checkpoint import State, Update, sum_answers, update_checkpoint
+from solutions import load_solution
+
+Generator = Callable[[random.Random, int], bytes]
+"""A function generating random input data with a number of lines."""
+
+
+def generate_day_1(rng: random.Random, n_lines: int) -> bytes:
+    """Generate calibration lines with digits and written numbers."""
+    words = ["one", "two", "three", "eight", "nine", "x", "qz", "twone"]
+    lines = []
+    for _ in range(n_lines):
+        parts = rng.choices(words, k=rng.randint(0, 4))
+        parts.insert(rng.randint(0, len(parts)), str(rng.randint(0, 9)))
+        lines.append("".join(parts))
+    return "".join(line + "\n" for line in lines).encode("utf-8")
+
+
+def generate_day_2(rng: random.Random, n_lines: int) -> bytes:
+    """Generate games with rounds of cube counts."""
+    lines = []
+    for game_id in range(1, n_lines + 1):
+        rounds = []
+        for _ in range(rng.randint(1, 4)):
+            colours = rng.sample(["red", "green", "blue"], k=rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colours))
+        lines.append(f"Game {game_id}: " + "; ".join(rounds))
+    return "".join(line + "\n" for line in lines).encode("utf-8")
+
+
+def generate_day_4(rng: random.Random, n_lines: int) -> bytes:
+    """Generate scratchcards, with enough matches to win copies of later cards."""
+    lines = []
+    for number in range(1, n_lines + 1):
+        winning = rng.sample(range(1, 30), k=5)
+        drawn = rng.sample(range(1, 30), k=8)
+        lines.append(
+            f"Card {number:3}: "
+            + " ".join(f"{n:2}" for n in winning)
+            + " | "
+            + " ".join(f"{n:2}" for n in drawn)
+        )
+    return "".join(line + "\n" for line in lines).encode("utf-8")
+
+
+DAYS: dict[int, Generator] = {1: generate_day_1, 2: generate_day_2, 4: generate_day_4}
+"""The input generator for each day which supports incremental runs."""
+
+
+def get_update(day: int) -> Update:
+    """Get the update used by a day's incremental runs."""
+    module = load_solution(day)
+    if day == 4:
+        return module.update_answers
+    return sum_answers(module.solve)
+
+
+def solve(day: int, data: bytes) -> State:
+    """Solve the complete lines of the data at once."""
+    return load_solution(day).solve(data[: data.rfind(b"\n") + 1])
+
+
+def run_incremental(day: int, tmp_path: Path) -> State:
+    """Run a day incrementally on the data file, returning the answers."""
+    state = update_checkpoint(
+        tmp_path.joinpath("checkpoint.json"),
+        tmp_path.joinpath("data.txt"),
+        get_update(day),
+    )
+    return {name: state[name] for name in solve(day, b"")}
+
+
+@pytest.fixture(params=DAYS)
+def day(request) -> int:
+    return request.param
+
+
+@pytest.fixture
+def data(day: int) -> bytes:
+    return DAYS[day](random.Random(day), 40)
+
+
+def test_split_at_every_offset(day: int, data: bytes, tmp_path: Path):
+    """Splitting the data at any offset, even mid-line, gives the same answers."""
+    data_path = tmp_path.joinpath("data.txt")
+    for offset in range(len(data) + 1):
+        tmp_path.joinpath("checkpoint.json").unlink(missing_ok=True)
+        data_path.write_bytes(data[:offset])
+        assert run_incremental(day, tmp_path) == solve(day, data[:offset])
+        with data_path.open("ab") as file:
+            file.write(data[offset:])
+        assert run_incremental(day, tmp_path) == solve(day, data)
+
+
+def test_many_appends(day: int, data: bytes, tmp_path: Path):
+    """Appending the data in many random chunks gives the same answers."""
+    rng = random.Random(day)
+    offsets = sorted(rng.sample(range(1, len(data)), k=30)) + [len(data)]
+    data_path = tmp_path.joinpath("data.txt")
+    data_path.write_bytes(b"")
+
+    previous_offset = 0
+    for offset in offsets:
+        with data_path.open("ab") as file:
+            file.write(data[previous_offset:offset])
+        previous_offset = offset
+        assert run_incremental(day, tmp_path) == solve(day, data[:offset])
+
+
+def test_unchanged_rerun(day: int, data: bytes, tmp_path: Path):
+    """Running again without appending anything gives the same answers."""
+    tmp_path.joinpath("data.txt").write_bytes(data)
+    answers = run_incremental(day, tmp_path)
+    assert run_incremental(day, tmp_path) == answers == solve(day, data)
+
+
+def test_truncated_file(day: int, data: bytes, tmp_path: Path):
+    """A data file truncated after a run is processed from the start."""
+    data_path = tmp_path.joinpath("data.txt")
+    data_path.write_bytes(data)
+    run_incremental(day, tmp_path)
+
+    shorter_data = DAYS[day](random.Random(-day), 10)
+    with data_path.open("r+b") as file:
+        file.truncate(0)
+        file.write(shorter_data)
+    assert run_incremental(day, tmp_path) == solve(day, shorter_data)
+
+
+def test_overwritten_file(day: int, data: bytes, tmp_path: Path):
+    """A data file overwritten in place with data of the same size is detected."""
+    data_path = tmp_path.joinpath("data.txt")
+    data_path.write_bytes(data)
+    run_incremental(day, tmp_path)
+
+    # Replace the last line with one of the same length changing the answers.
+    head, last_line = data[:-1].rsplit(b"\n", 1)
+    answers = solve(day, data)
+    for seed in range(1000):
+        new_line = DAYS[day](random.Random(seed), 40)[:-1].rsplit(b"\n", 1)[1]
+        new_data = head + b"\n" + new_line + b"\n"
+        if len(new_line) == len(last_line) and solve(day, new_data) != answers:
+            break
+    else:
+        pytest.fail("No replacement line found")
+    with data_path.open("r+b") as file:
+        file.write(new_data)
+    assert run_incremental(day, tmp_path) == solve(day, new_data)
+
+
+def test_replaced_file(day: int, data: bytes, tmp_path: Path):
+    """A data file replaced by a different file is processed from the start."""
+    data_path = tmp_path.joinpath("data.txt")
+    data_path.write_bytes(data)
+    run_incremental(day, tmp_path)
+
+    # Keep the old file open so the new file can't reuse its inode.
+    with data_path.open("rb"):
+        new_data = DAYS[day](random.Random(-day), 40)
+        new_path = tmp_path.joinpath("new.txt")
+        new_path.write_bytes(new_data)
+        os.replace(new_path, data_path)
+        assert run_incremental(day, tmp_path) == solve(day, new_data)